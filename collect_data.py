@@ -6,32 +6,33 @@ PLS (Parkleitsystem) parking guidance systems.
 """
 
 import argparse
+import asyncio
+import importlib
 import json
+import logging
 import os
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 
+import aiohttp
+
 # Add collectors to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from collectors import (
-    LuzernCollector,
-    BaselCollector,
-    StGallenCollector,
-    ZurichCollector
-)
-
 
-# Collector class mapping
+# Collector class mapping ("module:class"), imported only for the cities
+# that are actually collected
 COLLECTOR_MAP = {
-    "luzern.LuzernCollector": LuzernCollector,
-    "basel.BaselCollector": BaselCollector,
-    "stgallen.StGallenCollector": StGallenCollector,
-    "zurich.ZurichCollector": ZurichCollector,
+    "luzern.LuzernCollector": "collectors.luzern:LuzernCollector",
+    "basel.BaselCollector": "collectors.basel:BaselCollector",
+    "stgallen.StGallenCollector": "collectors.stgallen:StGallenCollector",
+    "zurich.ZurichCollector": "collectors.zurich:ZurichCollector",
 }
 
+# Poll interval for cities without "poll_interval" in the configuration
+DEFAULT_POLL_INTERVAL = 900
+
 
 def load_config():
     """Load city configuration from config/cities.json."""
@@ -47,7 +48,21 @@ def load_config():
         sys.exit(1)
 
 
-def create_collector(city_id, city_config, data_dir="data"):
+def create_session():
+    """
+    Create the aiohttp session shared by all collectors.
+    
+    aiohttp speaks HTTP/1.1 only, so Basel and Zürich (both on
+    api.parkendd.de) use one pooled connection each when they are fetched
+    at the same time. HTTP/2 multiplexing would save one TLS handshake
+    per run. That does not justify replacing the HTTP client.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=4)
+    )
+
+
+def create_collector(city_id, city_config, data_dir="data", compress=False, jsonl=False):
     """
     Create a collector instance for a city.
     
@@ -55,83 +70,161 @@ def create_collector(city_id, city_config, data_dir="data"):
         city_id: City identifier
         city_config: City configuration dict
         data_dir: Base data directory
+        compress: Save gzip-compressed samples
+        jsonl: Append samples to one JSON Lines file per day
     
     Returns:
-        BaseParkingCollector instance or None if collector not found
+        BaseParkingCollector instance or None if the collector is not found
+        or the configuration is invalid
     """
     collector_class_name = city_config.get("collector")
-    collector_class = COLLECTOR_MAP.get(collector_class_name)
+    collector_spec = COLLECTOR_MAP.get(collector_class_name)
     
-    if not collector_class:
+    if not collector_spec:
         print(f"Warning: Collector '{collector_class_name}' not found for {city_id}")
         return None
     
+    poll_interval = city_config.get("poll_interval", DEFAULT_POLL_INTERVAL)
+    if not isinstance(poll_interval, (int, float)) or poll_interval <= 0:
+        print(f"Error: Invalid poll_interval {poll_interval!r} for {city_id}, must be > 0")
+        return None
+    
+    module_name, class_name = collector_spec.split(":")
+    collector_class = getattr(importlib.import_module(module_name), class_name)
+    
     return collector_class(
         city_id=city_id,
         city_name=city_config.get("name", city_id),
         api_url=city_config.get("api_url"),
-        data_dir=data_dir
+        data_dir=data_dir,
+        compress=compress,
+        jsonl=jsonl,
+        poll_interval=poll_interval
     )
 
 
-def collect_city_data(city_id, config, data_dir="data"):
+def build_collectors(config, data_dir="data", city_id=None, compress=False, jsonl=False):
     """
-    Collect data for a specific city.
+    Create collectors for all enabled cities, once at startup.
     
     Args:
-        city_id: City identifier
-        config: Full configuration dict
+        config: Configuration dict
         data_dir: Base data directory
+        city_id: Only build the collector for this city if given
+        compress: Save gzip-compressed samples
+        jsonl: Append samples to one JSON Lines file per day
     
     Returns:
-        bool: True if successful, False otherwise
+        tuple: (list of BaseParkingCollector instances, list of IDs of
+        enabled cities whose collector could not be created)
     """
     cities = config.get("cities", {})
     
-    if city_id not in cities:
-        print(f"Error: City '{city_id}' not found in configuration")
-        return False
-    
-    city_config = cities[city_id]
+    if city_id:
+        if city_id not in cities:
+            print(f"Error: City '{city_id}' not found in configuration")
+            return [], []
+        
+        if not cities[city_id].get("enabled", True):
+            print(f"Info: City '{city_id}' is disabled in configuration")
+            return [], []
+        
+        cities = {city_id: cities[city_id]}
     
-    if not city_config.get("enabled", True):
-        print(f"Info: City '{city_id}' is disabled in configuration")
-        return False
+    collectors = []
+    unresolved = []
     
-    collector = create_collector(city_id, city_config, data_dir)
-    if not collector:
-        return False
+    for cid, city_config in cities.items():
+        if not city_config.get("enabled", True):
+            print(f"Skipping disabled city: {cid}")
+            continue
+        
+        collector = create_collector(cid, city_config, data_dir, compress, jsonl)
+        if collector:
+            collectors.append(collector)
+        else:
+            unresolved.append(cid)
     
-    return collector.collect()
+    return collectors, unresolved
 
 
-def collect_all_cities(config, data_dir="data"):
+async def collect_all_cities(collectors, session=None):
     """
-    Collect data for all enabled cities.
+    Collect data for the given cities concurrently.
     
     Args:
-        config: Configuration dict
-        data_dir: Base data directory
+        collectors: List of BaseParkingCollector instances
+        session: Shared aiohttp.ClientSession (a new one is created if omitted)
     
     Returns:
         dict: Results for each city {city_id: success_bool}
     """
-    cities = config.get("cities", {})
-    results = {}
+    if session is None:
+        async with create_session() as session:
+            return await collect_all_cities(collectors, session)
     
-    for city_id, city_config in cities.items():
-        if not city_config.get("enabled", True):
-            print(f"Skipping disabled city: {city_id}")
-            continue
-        
-        print(f"\n{'='*60}")
-        print(f"Collecting data for: {city_config.get('name', city_id)}")
-        print(f"{'='*60}")
+    print(f"\n{'='*60}")
+    print(f"Collecting data for: {', '.join(c.city_name for c in collectors)}")
+    print(f"{'='*60}")
+    
+    outcomes = await asyncio.gather(
+        *(collector.collect(session) for collector in collectors),
+        return_exceptions=True
+    )
+    
+    # Unexpected exceptions count as a failed collection for that city
+    return {
+        collector.city_id: outcome is True
+        for collector, outcome in zip(collectors, outcomes)
+    }
+
+
+async def poll_city(collector, interval, session):
+    """
+    Collect data for one city every `interval` seconds until cancelled.
+    
+    Collections are scheduled against the monotonic event loop clock, so
+    the time spent collecting doesn't push the following samples back.
+    
+    Args:
+        collector: BaseParkingCollector instance
+        interval: Seconds between the start of two collections
+        session: Shared aiohttp.ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    
+    while True:
+        await collector.collect(session)
         
-        success = collect_city_data(city_id, config, data_dir)
-        results[city_id] = success
+        # Never schedule in the past, so an overrun doesn't cause a burst
+        next_tick = max(next_tick + interval, loop.time())
+        await asyncio.sleep(max(0, next_tick - loop.time()))
+
+
+async def run_continuously(collectors, interval=None):
+    """
+    Collect data until interrupted, each city on its own schedule.
+    
+    Every city runs as an independent task, so a city polled every minute
+    is never held up by a slower one. All tasks share one session so that
+    connections to the city APIs are kept alive between polls.
     
-    return results
+    Args:
+        collectors: List of BaseParkingCollector instances
+        interval: Seconds between collections for all cities; overrides
+            each collector's poll_interval if given
+    """
+    async with create_session() as session:
+        tasks = [
+            asyncio.create_task(poll_city(
+                collector,
+                interval if interval is not None else collector.poll_interval,
+                session
+            ))
+            for collector in collectors
+        ]
+        await asyncio.gather(*tasks)
 
 
 def main():
@@ -152,8 +245,8 @@ def main():
     parser.add_argument(
         "--interval",
         type=int,
-        default=900,
-        help="Interval in seconds for continuous monitoring (default: 900 = 15 mins)"
+        help="Interval in seconds for continuous monitoring, overrides each city's "
+             "poll_interval (default: poll_interval from config, else 900 = 15 mins)"
     )
     parser.add_argument(
         "--data-dir",
@@ -161,8 +254,22 @@ def main():
         default="data",
         help="Base directory for data storage (default: 'data')"
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Save samples gzip-compressed with a .gz suffix (not read by the dashboard)"
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Append samples to one {date}.jsonl file per city and day (not read by the dashboard)"
+    )
     
     args = parser.parse_args()
+    if args.interval is not None and args.interval <= 0:
+        parser.error("--interval must be greater than 0")
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     
     # Load configuration
     config = load_config()
@@ -170,16 +277,19 @@ def main():
     print(f"Swiss Parking Monitor - Starting at {datetime.now()}")
     print(f"Data directory: {args.data_dir}")
     
+    collectors, unresolved = build_collectors(
+        config, args.data_dir, args.city, args.compress, args.jsonl
+    )
+    if args.city and not collectors:
+        sys.exit(1)
+    
     if args.once:
         # Single collection run
-        if args.city:
-            # Collect specific city
-            success = collect_city_data(args.city, config, args.data_dir)
-            sys.exit(0 if success else 1)
-        else:
-            # Collect all cities
-            results = collect_all_cities(config, args.data_dir)
-            
+        results = asyncio.run(collect_all_cities(collectors))
+        # Cities without a usable collector count as failed
+        results.update({city_id: False for city_id in unresolved})
+        
+        if not args.city:
             # Print summary
             print(f"\n{'='*60}")
             print("Collection Summary:")
@@ -187,28 +297,27 @@ def main():
             for city_id, success in results.items():
                 status = "✓ Success" if success else "✗ Failed"
                 print(f"{city_id:15} {status}")
-            
-            # Exit with error if any city failed
-            all_success = all(results.values())
-            sys.exit(0 if all_success else 1)
+        
+        # Exit with error if any city failed
+        all_success = all(results.values())
+        sys.exit(0 if all_success else 1)
     else:
         # Continuous monitoring
-        print(f"Running continuously with {args.interval}s interval")
+        if not collectors:
+            print("Error: No city to collect, check the enabled cities and collectors in the configuration")
+            sys.exit(1)
+        
+        print("Running continuously with intervals:")
+        for collector in collectors:
+            interval = args.interval if args.interval is not None else collector.poll_interval
+            print(f"  {collector.city_id:15} {interval}s")
         print("Press Ctrl+C to stop\n")
         
         try:
-            while True:
-                if args.city:
-                    collect_city_data(args.city, config, args.data_dir)
-                else:
-                    collect_all_cities(config, args.data_dir)
-                
-                print(f"\nSleeping for {args.interval} seconds...")
-                time.sleep(args.interval)
+            asyncio.run(run_continuously(collectors, args.interval))
         except KeyboardInterrupt:
             print("\n\nStopped by user")
             sys.exit(0)
 
-
 if __name__ == "__main__":
     main()
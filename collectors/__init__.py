@@ -2,16 +2,32 @@
 Collectors module for Swiss parking monitoring system.
 """
 
-from .base import BaseParkingCollector
-from .luzern import LuzernCollector
-from .basel import BaselCollector
-from .stgallen import StGallenCollector
-from .zurich import ZurichCollector
+import importlib
+
+from .base import BaseParkingCollector, ParkingRecord
+
+# City collectors are imported on first access, so a single-city run only
+# loads the module it needs
+_LAZY_COLLECTORS = {
+    'LuzernCollector': '.luzern',
+    'BaselCollector': '.basel',
+    'StGallenCollector': '.stgallen',
+    'ZurichCollector': '.zurich',
+}
 
 __all__ = [
     'BaseParkingCollector',
+    'ParkingRecord',
     'LuzernCollector',
     'BaselCollector',
     'StGallenCollector',
     'ZurichCollector',
 ]
+
+
+def __getattr__(name):
+    """Import city collectors on first attribute access (PEP 562)."""
+    if name in _LAZY_COLLECTORS:
+        module = importlib.import_module(_LAZY_COLLECTORS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
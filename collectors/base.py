@@ -2,17 +2,65 @@
 Base parking collector class for all city-specific collectors.
 """
 
-import requests
-import json
+import aiohttp
+import asyncio
+import gzip
+import logging
+import orjson
 import os
 from datetime import datetime
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+log = logging.getLogger(__name__)
+
+# Transient HTTP errors are retried with exponential back-off
+# (0.4s, 0.8s, 1.6s, 3.2s) instead of losing the sample
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 4
+_BACKOFF_FACTOR = 0.4
+
+
+def _is_transient(error):
+    """Tell whether a failed fetch is worth retrying."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in _RETRY_STATUSES
+    # TLS and certificate problems won't go away by retrying
+    if isinstance(error, (aiohttp.ClientSSLError, aiohttp.ServerFingerprintMismatch)):
+        return False
+    return isinstance(
+        error,
+        (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+    )
+
+
+def _write_all(fd, payload):
+    """Write the whole payload to fd; os.write may write only part of it."""
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        if written == 0:
+            raise IOError(f"Short write ({len(view)} bytes left)")
+        view = view[written:]
+
+
+@dataclass(slots=True)
+class ParkingRecord:
+    """Normalized state of a single parking facility (serialized as a JSON object)."""
+    id: str
+    name: str
+    free: int
+    total: int
+    status: str
+    timestamp: str
 
 
 class BaseParkingCollector(ABC):
     """Abstract base class for parking data collectors."""
     
-    def __init__(self, city_id, city_name, api_url, data_dir="data"):
+    def __init__(self, city_id, city_name, api_url, data_dir="data", compress=False, jsonl=False,
+                 poll_interval=900):
         """
         Initialize the collector.
         
@@ -21,30 +69,85 @@ class BaseParkingCollector(ABC):
             city_name: Display name of the city
             api_url: API endpoint URL
             data_dir: Base directory for data storage
+            compress: Save samples gzip-compressed (.gz suffix)
+            jsonl: Append samples to one JSON Lines file per day
+            poll_interval: Seconds between collections in continuous mode
         """
         self.city_id = city_id
         self.city_name = city_name
         self.api_url = api_url
         self.data_dir = data_dir
+        self.compress = compress
+        self.jsonl = jsonl
+        self.poll_interval = poll_interval
         self.city_data_dir = os.path.join(data_dir, city_id)
+        self._last_target_dir = None
+        # Cache validators and parsed payload of the last successful fetch,
+        # used for conditional requests (HTTP 304 Not Modified)
+        self._etag = None
+        self._last_modified = None
+        self._last_raw_data = None
     
-    def fetch_raw_data(self):
+    async def fetch_raw_data(self, session):
         """
         Fetch raw data from the API.
         
+        Connection errors, timeouts and transient HTTP errors (429, 5xx)
+        are retried with exponential back-off. Once a result is cached, the
+        request is sent conditionally with If-None-Match/If-Modified-Since.
+        
+        Args:
+            session: Shared aiohttp.ClientSession
+        
         Returns:
-            dict: Raw API response as JSON
+            dict: Raw API response as JSON (the cached payload if the data
+            has not changed since the last fetch, HTTP 304)
         
         Raises:
-            requests.RequestException: If the API request fails
+            aiohttp.ClientError: If the API request fails
+            asyncio.TimeoutError: If the API does not answer in time
+            orjson.JSONDecodeError: If the response is not valid JSON
         """
-        try:
-            response = requests.get(self.api_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"[{datetime.now()}] Error fetching data for {self.city_name}: {e}")
-            raise
+        headers = {}
+        if self._last_raw_data is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        
+        attempt = 0
+        
+        while True:
+            try:
+                async with session.get(
+                    self.api_url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    if response.status == 304 and headers:
+                        log.debug("%s: Not modified, reusing last payload", self.city_name)
+                        return self._last_raw_data
+                    
+                    response.raise_for_status()
+                    # Parse the raw bytes directly; this also ignores the content
+                    # type, which some PLS APIs don't set to application/json
+                    raw_data = orjson.loads(await response.read())
+                    self._etag = response.headers.get("ETag")
+                    self._last_modified = response.headers.get("Last-Modified")
+                    self._last_raw_data = raw_data
+                    return raw_data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not _is_transient(e) or attempt >= _MAX_RETRIES:
+                    log.error("Error fetching data for %s: %s", self.city_name, e)
+                    raise
+                
+                delay = _BACKOFF_FACTOR * 2 ** attempt
+                attempt += 1
+                log.warning("%s: Fetch failed (%s), retrying in %.1fs", self.city_name, e, delay)
+                await asyncio.sleep(delay)
+            except orjson.JSONDecodeError as e:
+                log.error("Error fetching data for %s: %s", self.city_name, e)
+                raise
     
     @abstractmethod
     def normalize_data(self, raw_data):
@@ -61,14 +164,14 @@ class BaseParkingCollector(ABC):
                 "city": "city_id",
                 "data": {
                     "parkings": {
-                        "PARKING_ID": {
-                            "id": "PARKING_ID",
-                            "name": "Parking Name",
-                            "free": 150,
-                            "total": 200,
-                            "status": "open",
-                            "timestamp": "2026-01-06T07:30:00+01:00"
-                        }
+                        "PARKING_ID": ParkingRecord(
+                            id="PARKING_ID",
+                            name="Parking Name",
+                            free=150,
+                            total=200,
+                            status="open",
+                            timestamp="2026-01-06T07:30:00+01:00"
+                        )
                     }
                 },
                 "timestamp": "2026-01-06T07:30:00+01:00"
@@ -76,52 +179,170 @@ class BaseParkingCollector(ABC):
         """
         pass
     
-    def save_data(self, data):
+    def save_data(self, data, now=None):
         """
-        Save normalized data to JSON file.
+        Save normalized data to disk.
+        
+        By default every sample gets its own {date}/{time}.json file. With
+        JSON Lines enabled, samples are appended to a daily {date}.jsonl file
+        instead. Compression adds a .gz suffix to either layout.
         
         Args:
             data: Normalized parking data
+            now: Collection time used for the file name (defaults to now)
         """
         if not data:
             return
         
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         date_str = now.strftime("%Y-%m-%d")
         time_str = now.strftime("%H-%M-%S")
         
-        # Create directory for today if it doesn't exist
-        day_dir = os.path.join(self.city_data_dir, date_str)
-        os.makedirs(day_dir, exist_ok=True)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.jsonl:
+            target_dir = self.city_data_dir
+            filename = f"{date_str}.jsonl"
+            payload = orjson.dumps(data, option=option) + b"\n"
+        else:
+            target_dir = f"{self.city_data_dir}/{date_str}"
+            filename = f"{time_str}.json"
+            # Indentation is pointless in a compressed file
+            if not self.compress:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, option=option)
+        
+        if self.compress:
+            # Level 1 keeps the CPU cost negligible while still shrinking the
+            # data ~10x; appended gzip members read back as a single stream
+            filename = f"{filename}.gz"
+            payload = gzip.compress(payload, compresslevel=1)
+        
+        # Create the target directory (the day directory, or the city
+        # directory for JSON Lines) only when it changes
+        if target_dir != self._last_target_dir:
+            os.makedirs(target_dir, exist_ok=True)
+            self._last_target_dir = target_dir
+        
+        # Plain f-strings: city_data_dir is joined once in __init__, and "/"
+        # is accepted as separator on every platform
+        filepath = f"{target_dir}/{filename}"
         
-        filename = f"{time_str}.json"
-        filepath = os.path.join(day_dir, filename)
+        tmp_path = None
         
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"[{now}] {self.city_name}: Data saved to {filepath}")
+            if self.jsonl:
+                # Each city file has a single writer (its collector), so
+                # appended lines never interleave
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    _write_all(fd, payload)
+                finally:
+                    os.close(fd)
+            else:
+                # Write to a temporary file and rename it into place, so
+                # readers never see a partially written sample
+                tmp_path = f"{filepath}.tmp"
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    _write_all(fd, payload)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, filepath)
+            log.info("%s: Data saved to %s", self.city_name, filepath)
         except IOError as e:
-            print(f"[{now}] {self.city_name}: Error saving data: {e}")
+            log.error("%s: Error saving data: %s", self.city_name, e)
+            # Don't leave the partial file behind for the commit step
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
-    def collect(self):
+    async def collect(self, session):
         """
         Main collection method: fetch, normalize, and save data.
         
+        Args:
+            session: Shared aiohttp.ClientSession
+        
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            print(f"[{datetime.now()}] {self.city_name}: Fetching data...")
-            raw_data = self.fetch_raw_data()
+            now = datetime.now()
+            log.debug("%s: Fetching data...", self.city_name)
+            raw_data = await self.fetch_raw_data(session)
             
-            print(f"[{datetime.now()}] {self.city_name}: Normalizing data...")
+            # Normalize even a cached (304) payload, so that fallback and
+            # poll timestamps reflect this collection
+            log.debug("%s: Normalizing data...", self.city_name)
             normalized_data = self.normalize_data(raw_data)
             
-            print(f"[{datetime.now()}] {self.city_name}: Saving data...")
-            self.save_data(normalized_data)
+            log.debug("%s: Saving data...", self.city_name)
+            # Disk I/O blocks, so run it in the default thread pool to keep
+            # the other cities' requests moving
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.save_data, normalized_data, now)
             
             return True
         except Exception as e:
-            print(f"[{datetime.now()}] {self.city_name}: Collection failed: {e}")
+            log.error("%s: Collection failed: %s", self.city_name, e)
+            # Make the next request unconditional, in case the cached
+            # payload is what failed
+            self._last_raw_data = None
             return False
+    
+    def _normalize_parkendd(self, raw_data):
+        """
+        Normalize ParkenDD API data (Basel, Zürich) to unified format.
+        
+        ParkenDD format:
+        {
+            "lots": [
+                {
+                    "id": "baselparkhauscity",
+                    "name": "City",
+                    "free": 901,
+                    "total": 1114,
+                    "state": "open",
+                    "address": "...",
+                    "coords": {"lat": ..., "lng": ...}
+                }
+            ],
+            "last_updated": "2026-01-06T05:35:00"
+        }
+        
+        The payload is decoded in one go rather than stream-parsed: a city
+        has a few dozen lots (a few KB of JSON), so orjson on the whole body
+        is both faster and simpler than an incremental parser.
+        """
+        if not raw_data or "lots" not in raw_data:
+            return None
+        
+        parkings = {}
+        now_iso = datetime.now().isoformat()
+        timestamp = raw_data.get("last_updated", now_iso)
+        
+        for lot in raw_data.get("lots", []):
+            parking_id = lot.get("id", "")
+            if not parking_id:
+                continue
+            
+            parkings[parking_id] = ParkingRecord(
+                id=parking_id,
+                name=lot.get("name", parking_id),
+                free=lot.get("free", 0),
+                total=lot.get("total", 0),
+                status=lot.get("state", "unknown"),
+                timestamp=timestamp
+            )
+        
+        return {
+            "status": "success",
+            "city": self.city_id,
+            "data": {
+                "parkings": parkings
+            },
+            "timestamp": timestamp
+        }
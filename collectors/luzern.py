@@ -3,7 +3,7 @@ Luzern parking data collector.
 """
 
 from datetime import datetime
-from .base import BaseParkingCollector
+from .base import BaseParkingCollector, ParkingRecord
 
 
 class LuzernCollector(BaseParkingCollector):
@@ -19,17 +19,18 @@ class LuzernCollector(BaseParkingCollector):
             return None
         
         parkings = {}
+        now_iso = datetime.now().isoformat()
         raw_parkings = raw_data.get("data", {}).get("parkings", {})
         
         for parking_id, parking_data in raw_parkings.items():
-            parkings[parking_id] = {
-                "id": parking_id,
-                "name": parking_data.get("description", parking_id),
-                "free": parking_data.get("vacancy", 0),
-                "total": parking_data.get("capacity", 0),
-                "status": "open" if parking_data.get("opened", True) and not parking_data.get("maintenance", False) else "closed",
-                "timestamp": parking_data.get("datestamp", datetime.now().isoformat())
-            }
+            parkings[parking_id] = ParkingRecord(
+                id=parking_id,
+                name=parking_data.get("description", parking_id),
+                free=parking_data.get("vacancy", 0),
+                total=parking_data.get("capacity", 0),
+                status="open" if parking_data.get("opened", True) and not parking_data.get("maintenance", False) else "closed",
+                timestamp=parking_data.get("datestamp", now_iso)
+            )
         
         return {
             "status": "success",
@@ -37,5 +38,5 @@ class LuzernCollector(BaseParkingCollector):
             "data": {
                 "parkings": parkings
             },
-            "timestamp": raw_data.get("data", {}).get("time", datetime.now().isoformat())
+            "timestamp": raw_data.get("data", {}).get("time", now_iso)
         }
@@ -3,7 +3,15 @@ St. Gallen parking data collector.
 """
 
 from datetime import datetime
-from .base import BaseParkingCollector
+from .base import BaseParkingCollector, ParkingRecord
+
+
+# Map St. Gallen status to standard status
+_STATUS_MAP = {
+    "offen": "open",
+    "geschlossen": "closed",
+    "nicht verfügbar": "nodata"
+}
 
 
 class StGallenCollector(BaseParkingCollector):
@@ -35,6 +43,7 @@ class StGallenCollector(BaseParkingCollector):
             return None
         
         parkings = {}
+        now_iso = datetime.now().isoformat()
         
         for record in raw_data.get("records", []):
             fields = record.get("fields", {})
@@ -42,23 +51,17 @@ class StGallenCollector(BaseParkingCollector):
             if not parking_id:
                 continue
             
-            # Map St. Gallen status to standard status
-            status_map = {
-                "offen": "open",
-                "geschlossen": "closed",
-                "nicht verfügbar": "nodata"
-            }
             raw_status = fields.get("phstate", "").lower()
-            status = status_map.get(raw_status, "unknown")
+            status = _STATUS_MAP.get(raw_status, "unknown")
             
-            parkings[parking_id] = {
-                "id": parking_id,
-                "name": fields.get("phname", parking_id),
-                "free": fields.get("shortfree", 0),
-                "total": fields.get("shortmax", 0),
-                "status": status,
-                "timestamp": fields.get("zeitpunkt", datetime.now().isoformat())
-            }
+            parkings[parking_id] = ParkingRecord(
+                id=parking_id,
+                name=fields.get("phname", parking_id),
+                free=fields.get("shortfree", 0),
+                total=fields.get("shortmax", 0),
+                status=status,
+                timestamp=fields.get("zeitpunkt", now_iso)
+            )
         
         return {
             "status": "success",
@@ -66,5 +69,5 @@ class StGallenCollector(BaseParkingCollector):
             "data": {
                 "parkings": parkings
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }